@@ -14,17 +14,45 @@ import os
 import sys
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import shutil
 
+try:
+    import ijson
+except ImportError:  # Optional: falls back to json.loads on the whole report.
+    ijson = None
+
 
 # Repo root + Maven `target/` folder.
 ROOT = Path(__file__).resolve().parents[1]
 TARGET = ROOT / "target"
 BADGES_DIR = ROOT / "badges"
 
+# Report locations inside `target/`.
+JACOCO_REPORT = TARGET / "site" / "jacoco" / "jacoco.xml"
+PITEST_REPORT = TARGET / "pit-reports" / "mutations.xml"
+DEPENDENCY_CHECK_REPORT = TARGET / "dependency-check-report.json"
+SUREFIRE_DIR = TARGET / "surefire-reports"
+SPOTBUGS_REPORTS = (TARGET / "spotbugsXml.xml", TARGET / "spotbugs.xml")
+
+# The script runs once per CI job, so the job's environment is read once here.
+MATRIX_OS = os.environ.get("MATRIX_OS", "unknown-os")
+MATRIX_JAVA = os.environ.get("MATRIX_JAVA", "unknown")
+SUMMARY_PATH = os.environ.get("GITHUB_STEP_SUMMARY")
+
+# CPython swaps in the C accelerator (`_elementtree`) behind the stdlib API.
+# Report parsing is an order of magnitude slower on the pure-Python fallback,
+# so we detect it once at import and warn instead of silently crawling.
+try:
+    import _elementtree
+
+    ET_ACCELERATED = ET.Element is _elementtree.Element
+except ImportError:
+    ET_ACCELERATED = False
+
 
 def percent(part: float, whole: float) -> float:
     """Return percentage helper rounded to 0.1 with zero guard."""
@@ -35,7 +63,7 @@ def percent(part: float, whole: float) -> float:
 
 def load_jacoco() -> Optional[Dict[str, float]]:
     """Parse JaCoCo XML and return a dict with line-level coverage."""
-    report = TARGET / "site" / "jacoco" / "jacoco.xml"
+    report = JACOCO_REPORT
     if not report.exists():
         return None
     try:
@@ -43,46 +71,56 @@ def load_jacoco() -> Optional[Dict[str, float]]:
     except ET.ParseError:
         return None
 
+    # Prefer the report-level counter; fall back to the first nested one.
+    # The [@type] predicate is matched inside the C ElementTree, not in Python.
     root = tree.getroot()
-    counters = root.findall("./counter")
-    if not counters:
-        counters = root.iter("counter")
-    for counter in counters:
-        if counter.attrib.get("type") == "LINE":
-            covered = int(counter.attrib.get("covered", "0"))
-            missed = int(counter.attrib.get("missed", "0"))
-            total = covered + missed
-            return {
-                "covered": covered,
-                "missed": missed,
-                "total": total,
-                "pct": percent(covered, total),
-            }
-    return None
+    counter = root.find("counter[@type='LINE']")
+    if counter is None:
+        counter = root.find(".//counter[@type='LINE']")
+    if counter is None:
+        return None
+
+    covered = int(counter.attrib.get("covered", "0"))
+    missed = int(counter.attrib.get("missed", "0"))
+    total = covered + missed
+    return {
+        "covered": covered,
+        "missed": missed,
+        "total": total,
+        "pct": percent(covered, total),
+    }
 
 
 def load_pitest() -> Optional[Dict[str, float]]:
     """Parse PITest mutations.xml for kill/survive counts."""
-    report = TARGET / "pit-reports" / "mutations.xml"
+    report = PITEST_REPORT
     if not report.exists():
         return None
+
+    # Stream the report: mutations.xml can reach tens of MB on CI, and we only
+    # need three counters, so tally in one pass and drop each element as we go.
+    status_counts = {"KILLED": 0, "SURVIVED": 0}
+    total = detected = 0
     try:
-        tree = ET.parse(report)
+        for _, elem in ET.iterparse(report, events=("end",)):
+            if elem.tag != "mutation":
+                continue
+            total += 1
+            attrib = elem.attrib
+            status = attrib.get("status")
+            if status in status_counts:
+                status_counts[status] += 1
+            if attrib.get("detected") == "true":
+                detected += 1
+            elem.clear()
     except ET.ParseError:
         return None
 
-    mutations = list(tree.getroot().iter("mutation"))
-    total = len(mutations)
-    if total == 0:
-        return {"total": 0, "killed": 0, "survived": 0, "detected": 0, "pct": 0.0}
-
-    killed = sum(1 for m in mutations if m.attrib.get("status") == "KILLED")
-    survived = sum(1 for m in mutations if m.attrib.get("status") == "SURVIVED")
-    detected = sum(1 for m in mutations if m.attrib.get("detected") == "true")
+    killed = status_counts["KILLED"]
     return {
         "total": total,
         "killed": killed,
-        "survived": survived,
+        "survived": status_counts["SURVIVED"],
         "detected": detected,
         "pct": percent(killed, total),
     }
@@ -98,31 +136,44 @@ SEVERITY_LABELS = {
 }
 
 
+def _iter_dependencies(report: Path) -> Iterator[Dict[str, object]]:
+    """
+    Yield each entry of the report's `dependencies` array.
+    With ijson installed the (often 50-200MB) report is streamed one dependency
+    at a time; otherwise the whole document is loaded.
+    """
+    if ijson is not None:
+        with report.open("rb") as handle:
+            yield from ijson.items(handle, "dependencies.item")
+        return
+    yield from json.loads(report.read_text()).get("dependencies", [])
+
+
 def load_dependency_check() -> Optional[Dict[str, object]]:
     """Parse Dependency-Check JSON for vulnerability counts."""
-    report = TARGET / "dependency-check-report.json"
+    report = DEPENDENCY_CHECK_REPORT
     if not report.exists():
         return None
-    try:
-        data = json.loads(report.read_text())
-    except json.JSONDecodeError:
-        return None
 
-    dependencies = data.get("dependencies", [])
-    dep_count = len(dependencies)
+    dep_count = 0
     vulnerable_deps = 0
     vuln_total = 0
     severity_counts = defaultdict(int)
-    for dep in dependencies:
-        vulns = dep.get("vulnerabilities") or []
-        if vulns:
-            vulnerable_deps += 1
-            vuln_total += len(vulns)
-            for vuln in vulns:
-                severity = (vuln.get("severity") or "UNKNOWN").upper()
-                if severity not in SEVERITY_ORDER:
-                    severity = "UNKNOWN"
-                severity_counts[severity] += 1
+    parse_errors = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+    try:
+        for dep in _iter_dependencies(report):
+            dep_count += 1
+            vulns = dep.get("vulnerabilities") or []
+            if vulns:
+                vulnerable_deps += 1
+                vuln_total += len(vulns)
+                for vuln in vulns:
+                    severity = (vuln.get("severity") or "UNKNOWN").upper()
+                    if severity not in SEVERITY_ORDER:
+                        severity = "UNKNOWN"
+                    severity_counts[severity] += 1
+    except parse_errors:
+        return None
 
     for key in SEVERITY_ORDER:
         severity_counts[key] = severity_counts.get(key, 0)
@@ -135,26 +186,48 @@ def load_dependency_check() -> Optional[Dict[str, object]]:
     }
 
 
+def _parse_suite(xml_path: Path) -> Optional[Tuple[int, int, int, int, float]]:
+    """Read (tests, failures, errors, skipped, time) from one Surefire report."""
+    # The totals live on the root <testsuite>, so stop after its start tag
+    # instead of building the whole <testcase> tree. A report truncated after
+    # that tag still counts; only files without a readable root are skipped.
+    try:
+        with xml_path.open("rb") as handle:
+            _, root = next(ET.iterparse(handle, events=("start",)))
+    except (ET.ParseError, StopIteration):
+        return None
+    attrib = root.attrib
+    return (
+        int(attrib.get("tests", 0)),
+        int(attrib.get("failures", 0)),
+        int(attrib.get("errors", 0)),
+        int(attrib.get("skipped", 0)),
+        float(attrib.get("time") or 0),
+    )
+
+
 def load_surefire() -> Optional[Dict[str, float]]:
     """Aggregate JUnit results from Surefire XML reports."""
-    report_dir = TARGET / "surefire-reports"
+    report_dir = SUREFIRE_DIR
     if not report_dir.exists():
         return None
 
     total = failures = errors = skipped = 0
     times: List[float] = []
 
-    for xml_path in report_dir.glob("TEST-*.xml"):
-        try:
-            tree = ET.parse(xml_path)
-        except ET.ParseError:
-            continue
-        root = tree.getroot()
-        total += int(root.attrib.get("tests", "0"))
-        failures += int(root.attrib.get("failures", "0"))
-        errors += int(root.attrib.get("errors", "0"))
-        skipped += int(root.attrib.get("skipped", "0"))
-        times.append(float(root.attrib.get("time", "0")))
+    # One small file per test class: the work is dominated by file reads,
+    # which release the GIL, so a thread pool overlaps them.
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for suite in executor.map(_parse_suite, report_dir.glob("TEST-*.xml")):
+            if suite is None:
+                continue
+            suite_tests, suite_failures, suite_errors, suite_skipped, suite_time = suite
+            total += suite_tests
+            failures += suite_failures
+            errors += suite_errors
+            skipped += suite_skipped
+            times.append(suite_time)
 
     if total == 0 and failures == 0 and errors == 0:
         return None
@@ -170,8 +243,7 @@ def load_surefire() -> Optional[Dict[str, float]]:
 
 def load_spotbugs_count() -> Optional[int]:
     """Parse SpotBugs XML report and count bug instances."""
-    for name in ("spotbugsXml.xml", "spotbugs.xml"):
-        report = TARGET / name
+    for report in SPOTBUGS_REPORTS:
         if not report.exists():
             continue
         try:
@@ -183,17 +255,29 @@ def load_spotbugs_count() -> Optional[int]:
     return None
 
 
-def bar(pct: float, width: int = 20) -> str:
+BAR_WIDTH = 20
+
+
+def _render_bar(pct: float, width: int) -> str:
     filled = int(round((pct / 100) * width))
     filled = max(0, min(width, filled))
     return "█" * filled + "░" * (width - filled)
 
 
+# Percentages arrive rounded to 0.1 (see `percent`), so every default-width bar
+# can be rendered up front and indexed by tenths of a percent.
+_BAR_TABLE = tuple(_render_bar(tenths / 10, BAR_WIDTH) for tenths in range(1001))
+
+
+def bar(pct: float, width: int = BAR_WIDTH) -> str:
+    if width != BAR_WIDTH:
+        return _render_bar(pct, width)
+    return _BAR_TABLE[min(1000, max(0, int(round(pct * 10))))]
+
+
 def section_header() -> str:
     """Identify the current matrix entry (os + JDK)."""
-    matrix_os = os.environ.get("MATRIX_OS", "unknown-os")
-    matrix_java = os.environ.get("MATRIX_JAVA", "unknown")
-    return f"### QA Metrics ({matrix_os}, JDK {matrix_java})"
+    return f"### QA Metrics ({MATRIX_OS}, JDK {MATRIX_JAVA})"
 
 
 def format_row(metric: str, value: str, detail: str) -> str:
@@ -439,6 +523,9 @@ def write_dashboard(
 
 
 def main() -> int:
+    if not ET_ACCELERATED:
+        print("[WARN] C-accelerated ElementTree unavailable; XML report parsing will be slow.", file=sys.stderr)
+
     summary_lines = [section_header(), "", "| Metric | Result | Details |", "| --- | --- | --- |"]
 
     tests = load_surefire()
@@ -504,10 +591,17 @@ def main() -> int:
 
     summary_text = "\n".join(summary_lines) + "\n"
 
-    summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
-    if summary_path:
-        with open(summary_path, "a", encoding="utf-8") as handle:
-            handle.write(summary_text)
+    if SUMMARY_PATH:
+        # Unbuffered O_APPEND writes land at the end of the file on local
+        # filesystems (not guaranteed on NFS). os.write may write fewer bytes
+        # than asked, so keep going until the whole summary is out.
+        data = memoryview(summary_text.encode("utf-8"))
+        fd = os.open(SUMMARY_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     else:
         print(summary_text)
 
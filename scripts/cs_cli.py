@@ -19,30 +19,41 @@ See: docs/design-notes/notes/clitool.md for the full design document.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import http.client
+import importlib.util
 import json
 import os
-import shutil
+import re
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.error import URLError
-from urllib.request import urlopen
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
+# Rich is imported lazily (see _get_console) so scripted invocations whose
+# output is redirected don't pay its import cost; only check it is installed.
 try:
     import typer
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
 except ImportError:
+    typer = None
+if typer is None or any(importlib.util.find_spec(name) is None for name in ("rich", "httpx")):
     print("Required dependencies not installed. Run:")
     print("  pip install -r scripts/requirements.txt")
     sys.exit(2)
 
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+    from rich.table import Table
+
 # Import from our modules
 from scripts.runtime_env import (
     DevEnvironment,
@@ -57,6 +68,8 @@ from scripts.dev_stack import (
     _resolve_compose_command,
     _maybe_install_frontend,
     _attach_signal_handlers,
+    _wait_for_first_exit,
+    _which,
 )
 
 # Constants
@@ -65,6 +78,12 @@ FRONTEND_DIR = ROOT / "ui" / "contact-app"
 COMPOSE_FILE = ROOT / "docker-compose.dev.yml"
 HEALTH_URL = "http://localhost:8080/actuator/health"
 FRONTEND_URL = "http://localhost:5173"
+TEST_LOG_DIR = ROOT / "target" / "cs-test-logs"
+DOCKER_SOCKET = "/var/run/docker.sock"
+POSTGRES_CONTAINER = "contactapp-postgres"
+HEALTH_REFRESH_SECONDS = 5.0  # health --watch period
+HEALTH_TABLE_TITLE = "Contact Suite Health Check"
+HEALTH_TABLE_HEADERS = ("Service", "Status", "Latency", "URL")
 
 # CLI App
 HELP_TEXT = """Contact Suite CLI - Unified developer experience
@@ -84,7 +103,6 @@ app = typer.Typer(
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
-console = Console()
 
 # Sub-apps for grouped commands
 db_app = typer.Typer(help="Database management commands")
@@ -95,34 +113,127 @@ app.add_typer(db_app, name="db")
 # Helper Functions
 # ==============================================================================
 
+# Matches Rich style tags such as [bold cyan] and [/red]
+_MARKUP_RE = re.compile(r"\[/?[a-z][a-z ]*\]")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _echo(message: str, plain: bool = False) -> None:
+    """Print Rich markup, or the bare text when Rich output is disabled."""
+    if plain:
+        print(_MARKUP_RE.sub("", message))
+    else:
+        _get_console().print(message)
+
+
+def _print_plain_table(title: str, headers: Sequence[str], rows: Sequence[Sequence[str]]) -> None:
+    """Render a table as aligned plain text for --no-rich output."""
+    cells = [list(headers)] + [[_MARKUP_RE.sub("", cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    print(title)
+    for row in cells:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+
+@functools.lru_cache(maxsize=None)
+def _http_client() -> "httpx.Client":
+    """
+    Shared keep-alive client for the health probes (thread-safe, closed at exit).
+    Imported lazily, like Rich, so commands that never probe don't pay for httpx.
+    """
+    import httpx
+
+    client = httpx.Client(limits=httpx.Limits(max_keepalive_connections=8))
+    atexit.register(client.close)
+    return client
+
+
+def _http_request(url: str, method: str = "GET", timeout: float = 5) -> Tuple[int, bytes]:
+    """Send a request over the shared keep-alive client and return (status, body)."""
+    response = _http_client().request(method, url, timeout=timeout)
+    return response.status_code, response.content
+
+
+# Actuator puts the aggregate status first: {"status":"UP","components":{...}}
+_STATUS_RE = re.compile(rb'"status"\s*:\s*"([A-Z_]+)"')
+_STATUS_SCAN_BYTES = 256
+
+
 def _check_health(url: str, timeout: int = 5) -> Tuple[bool, int, str]:
     """Check health of a service. Returns (is_up, latency_ms, status)."""
     start = time.time()
     try:
-        with urlopen(url, timeout=timeout) as response:
-            latency_ms = int((time.time() - start) * 1000)
-            if response.status == 200:
-                try:
-                    payload = json.loads(response.read().decode("utf-8"))
-                    status = payload.get("status", "UP")
-                except json.JSONDecodeError:
-                    status = "UP"
-                return True, latency_ms, status
-            return False, latency_ms, f"HTTP {response.status}"
-    except URLError as e:
+        code, body = _http_request(url, timeout=timeout)
         latency_ms = int((time.time() - start) * 1000)
-        return False, latency_ms, str(e.reason)
+        if code == 200:
+            # The body is read in full to keep the connection reusable, but only
+            # its head is scanned; a 200 without a status field still means UP.
+            match = _STATUS_RE.search(body, 0, _STATUS_SCAN_BYTES)
+            status = match.group(1).decode("ascii") if match else "UP"
+            return True, latency_ms, status
+        return False, latency_ms, f"HTTP {code}"
     except Exception as e:
         latency_ms = int((time.time() - start) * 1000)
         return False, latency_ms, str(e)
 
 
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket (used for the Docker Engine API)."""
+
+    def __init__(self, socket_path: str, timeout: float = 5):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+def _docker_container_state(name: str) -> Optional[str]:
+    """
+    Ask the Docker Engine API for a running container's state.
+    Returns "" when nothing matches and None when the socket can't be used
+    (Windows, custom DOCKER_HOST, permissions), so callers fall back to the CLI.
+    """
+    if not hasattr(socket, "AF_UNIX") or os.environ.get("DOCKER_HOST") or not os.path.exists(DOCKER_SOCKET):
+        return None
+    query = urlencode({"filters": json.dumps({"name": [name]})})
+    conn = _UnixHTTPConnection(DOCKER_SOCKET)
+    try:
+        conn.request("GET", f"/containers/json?{query}")
+        response = conn.getresponse()
+        if response.status != 200:
+            return None
+        containers = json.loads(response.read())
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
+    return containers[0].get("State", "") if containers else ""
+
+
 def _check_postgres() -> Tuple[bool, int, str]:
     """Check if Postgres container is running."""
     start = time.time()
+    # Talk to the Docker socket directly; forking `docker ps` costs 50-200ms.
+    state = _docker_container_state(POSTGRES_CONTAINER)
+    if state is not None:
+        latency_ms = int((time.time() - start) * 1000)
+        if state == "running":
+            return True, latency_ms, "UP"
+        return False, latency_ms, "Not running"
     try:
         result = subprocess.run(
-            ["docker", "ps", "--filter", "name=contactapp-postgres", "--format", "{{.Status}}"],
+            [_tool("docker"), "ps", "--filter", f"name={POSTGRES_CONTAINER}", "--format", "{{.Status}}"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -139,44 +250,148 @@ def _check_postgres() -> Tuple[bool, int, str]:
 
 def _check_frontend() -> Tuple[bool, int, str]:
     """Check if Vite dev server is running."""
+    import httpx
+
     start = time.time()
     try:
-        with urlopen(FRONTEND_URL, timeout=5) as response:
-            latency_ms = int((time.time() - start) * 1000)
-            if response.status == 200:
-                return True, latency_ms, "UP"
-            return False, latency_ms, f"HTTP {response.status}"
-    except URLError:
+        # HEAD: we only need the status line, not index.html
+        code, _ = _http_request(FRONTEND_URL, method="HEAD")
+        latency_ms = int((time.time() - start) * 1000)
+        if code == 200:
+            return True, latency_ms, "UP"
+        return False, latency_ms, f"HTTP {code}"
+    except httpx.TransportError:
         return False, int((time.time() - start) * 1000), "Not running"
     except Exception as e:
         return False, 0, str(e)
 
 
 def _confirm(message: str, default: bool = False) -> bool:
-    """Prompt for confirmation."""
+    """Prompt for confirmation. Non-interactive stdin (CI, pipes) gets the default."""
+    if not sys.stdin.isatty():
+        return default
     suffix = " [y/N]: " if not default else " [Y/n]: "
-    response = input(message + suffix).strip().lower()
+    # Read the line directly rather than via input(), which loads readline
+    sys.stdout.write(message + suffix)
+    sys.stdout.flush()
+    response = sys.stdin.readline().strip().lower()
     if not response:
         return default
     return response in ("y", "yes")
 
 
-def _run_maven(goals: List[str], env: Optional[Dict[str, str]] = None) -> int:
+def _tool(name: str) -> str:
+    """
+    Resolve an executable on PATH once per process (also finds mvn.cmd/npm.cmd
+    on Windows). Raises FileNotFoundError naming the missing tool.
+    """
+    path = _which(name)
+    if path is None:
+        raise FileNotFoundError(f"'{name}' not found on PATH")
+    return path
+
+
+def _run_command(
+    cmd: List[str],
+    cwd: Path,
+    env: Optional[Dict[str, str]] = None,
+    log_path: Optional[Path] = None,
+    plain: bool = False,
+) -> int:
+    """Run a command, streaming output to the terminal or to log_path if given."""
+    _echo(f"[dim]Running: {' '.join(cmd)}[/dim]", plain)
+    try:
+        argv = [_tool(cmd[0])] + cmd[1:]
+    except FileNotFoundError as e:
+        _echo(f"[red]{e}[/red]", plain)
+        return 127
+    if log_path is None:
+        return subprocess.run(argv, cwd=str(cwd), env=env).returncode
+    with log_path.open("w", encoding="utf-8") as log:
+        return subprocess.run(argv, cwd=str(cwd), env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+
+
+def _run_interruptible(cmd: List[str], cwd: Path) -> int:
+    """
+    Run a foreground command. On Ctrl+C, forward SIGINT, give the child 2s to
+    exit, then terminate it so no orphaned process outlives the CLI.
+    """
+    proc = subprocess.Popen(cmd, cwd=str(cwd))
+    try:
+        return proc.wait()
+    except KeyboardInterrupt:
+        # Windows only supports CTRL_* events via send_signal; terminate below instead.
+        if os.name == "posix":
+            proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.terminate()
+            proc.wait()
+        return 130
+
+
+def _run_maven(
+    goals: List[str],
+    env: Optional[Dict[str, str]] = None,
+    plain: bool = False,
+    log_path: Optional[Path] = None,
+) -> int:
     """Run Maven with given goals."""
-    cmd = ["mvn"] + goals
-    console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
     # Merge with current environment to preserve PATH, JAVA_HOME, etc.
     merged_env = {**os.environ, **(env or {})}
-    result = subprocess.run(cmd, cwd=str(ROOT), env=merged_env)
-    return result.returncode
+    return _run_command(["mvn"] + goals, ROOT, env=merged_env, log_path=log_path, plain=plain)
 
 
-def _run_npm(args: List[str], cwd: Path = FRONTEND_DIR) -> int:
+def _run_npm(args: List[str], cwd: Path = FRONTEND_DIR, log_path: Optional[Path] = None) -> int:
     """Run npm with given args."""
-    cmd = ["npm"] + args
-    console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-    result = subprocess.run(cmd, cwd=str(cwd))
-    return result.returncode
+    return _run_command(["npm"] + args, cwd, log_path=log_path)
+
+
+# A check runner takes an optional log file and returns the exit code.
+CheckRunner = Callable[[Optional[Path]], int]
+
+
+def _run_checks_concurrently(jobs: List[Tuple[str, str, CheckRunner]]) -> Dict[str, Tuple[int, Path]]:
+    """
+    Run (group, name, runner) jobs: groups run side by side, jobs within a group
+    run in order. Output goes to per-check logs so parallel runs don't interleave.
+    """
+    TEST_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    groups: Dict[str, List[Tuple[str, CheckRunner]]] = {}
+    for group, name, runner in jobs:
+        groups.setdefault(group, []).append((name, runner))
+
+    # Ctrl+C lands in the main thread; workers see it through this event (or
+    # through their child exiting on SIGINT) and stop launching checks.
+    stop = threading.Event()
+
+    def run_group(members: List[Tuple[str, CheckRunner]]) -> List[Tuple[str, int, Path]]:
+        finished = []
+        for name, runner in members:
+            if stop.is_set():
+                break
+            log_path = TEST_LOG_DIR / f"{name.lower().replace(' ', '-')}.log"
+            rc = runner(log_path)
+            style, status = ("green", "PASS") if rc == 0 else ("red", "FAIL")
+            _get_console().print(f"[{style}]{status}[/{style}] {name} [dim]({log_path.relative_to(ROOT)})[/dim]")
+            finished.append((name, rc, log_path))
+            if rc == 130 or rc < 0:
+                stop.set()
+                break
+        return finished
+
+    results: Dict[str, Tuple[int, Path]] = {}
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [executor.submit(run_group, members) for members in groups.values()]
+        try:
+            for future in as_completed(futures):
+                for name, rc, log_path in future.result():
+                    results[name] = (rc, log_path)
+        except KeyboardInterrupt:
+            stop.set()
+            raise
+    return results
 
 
 # ==============================================================================
@@ -200,17 +415,34 @@ def dev(
         ./scripts/run dev --backend-only     # Skip frontend
         ./scripts/run dev --frontend-only    # Skip backend (assumes already running)
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    console = _get_console()
     if backend_only and frontend_only:
         console.print("[red]Cannot use --backend-only and --frontend-only together.[/red]")
         raise typer.Exit(1)
 
+    # Fail fast on missing tools instead of after Postgres is already up
+    try:
+        mvn = None if frontend_only else _tool("mvn")
+        npm = None if backend_only else _tool("npm")
+    except FileNotFoundError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    # Build environment (rejects unknown --db values before anything starts)
+    try:
+        DevEnvironment(database=db).apply()
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
     console.print(Panel.fit(
         "[bold green]Contact Suite Development Environment[/bold green]",
         subtitle=f"Database: {db.upper()}"
     ))
-
-    # Build environment
-    env = DevEnvironment(database=db).build()
     running: List[Tuple[str, subprocess.Popen]] = []
     _attach_signal_handlers(running)
 
@@ -229,8 +461,8 @@ def dev(
         # Start backend
         if not frontend_only:
             console.print("\n[bold]Starting Spring Boot backend...[/bold]")
-            backend_cmd = ["mvn", "spring-boot:run"]
-            backend = _start_process(backend_cmd, cwd=ROOT, env=env)
+            backend_cmd = [mvn, "spring-boot:run"]
+            backend = _start_process(backend_cmd, cwd=ROOT)
             running.append(("backend", backend))
 
             with Progress(
@@ -253,7 +485,7 @@ def dev(
         if not backend_only:
             console.print("\n[bold]Starting Vite frontend...[/bold]")
             _maybe_install_frontend(skip_install)
-            frontend_cmd = ["npm", "run", "dev", "--", "--port", "5173"]
+            frontend_cmd = [npm, "run", "dev", "--", "--port", "5173"]
             frontend = _start_process(frontend_cmd, cwd=FRONTEND_DIR)
             running.append(("frontend", frontend))
             console.print("[green]Frontend starting...[/green]")
@@ -271,13 +503,10 @@ def dev(
         console.print(table)
         console.print("\n[dim]Press Ctrl+C to stop all services[/dim]\n")
 
-        # Keep running until interrupted
-        while True:
-            for name, proc in running:
-                if proc.poll() is not None:
-                    console.print(f"[red]{name} exited with code {proc.returncode}[/red]")
-                    raise typer.Exit(1)
-            time.sleep(1)
+        # Keep running until interrupted or a service exits
+        name, proc = _wait_for_first_exit(running)
+        console.print(f"[red]{name} exited with code {proc.returncode}[/red]")
+        raise typer.Exit(1)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Shutting down...[/yellow]")
@@ -308,6 +537,9 @@ def prod_local(
         ./scripts/run prod-local
         ./scripts/run prod-local --skip-build    # Use existing JAR
     """
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print(Panel.fit(
         "[bold yellow]Production Simulation Mode[/bold yellow]",
         subtitle="Secure cookies, strict CSP"
@@ -318,11 +550,17 @@ def prod_local(
         env_builder = ProdLocalEnvironment()
         if https:
             env_builder.with_https()
-        env = env_builder.build()
+        env_builder.apply()
     except ValueError as e:
         console.print(f"[red]Configuration Error:[/red]\n{e}")
         raise typer.Exit(1)
 
+    try:
+        java = _tool("java")
+    except FileNotFoundError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
     # Build JAR if needed
     if not skip_build:
         console.print("\n[bold]Building production JAR...[/bold]")
@@ -331,13 +569,22 @@ def prod_local(
             console.print("[red]Build failed[/red]")
             raise typer.Exit(1)
 
-    # Find JAR
-    jar_files = list((ROOT / "target").glob("*.jar"))
-    jar_files = [j for j in jar_files if not j.name.endswith("-sources.jar")]
-    if not jar_files:
+    # Find JAR: stop at the first artifact in target/ that isn't -sources.jar
+    try:
+        with os.scandir(ROOT / "target") as entries:
+            jar_path = next(
+                (
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".jar") and not entry.name.endswith("-sources.jar")
+                ),
+                None,
+            )
+    except FileNotFoundError:
+        jar_path = None
+    if jar_path is None:
         console.print("[red]No JAR file found in target/. Run without --skip-build.[/red]")
         raise typer.Exit(1)
-    jar_path = jar_files[0]
 
     # Start Postgres
     console.print("\n[bold]Starting Postgres...[/bold]")
@@ -349,9 +596,8 @@ def prod_local(
 
     try:
         result = subprocess.run(
-            ["java", "-jar", str(jar_path)],
+            [java, "-jar", str(jar_path)],
             cwd=str(ROOT),
-            env=env,
         )
         raise typer.Exit(result.returncode)
     except KeyboardInterrupt:
@@ -370,60 +616,59 @@ def test(
     mutation: bool = typer.Option(False, "--mutation", help="PITest mutation testing"),
     security: bool = typer.Option(False, "--security", help="OWASP + API fuzzing"),
     fast: bool = typer.Option(False, "--fast", help="Skip slow tests (mutation, fuzzing)"),
+    sequential: bool = typer.Option(False, "--sequential", help="Run checks one at a time with live output"),
 ):
     """
     Run all quality checks.
 
+    Maven checks and frontend tests run side by side with output written to
+    target/cs-test-logs/; use --sequential for live output. A single group
+    (e.g. --unit) always runs with live output.
+
     [bold]Examples:[/bold]
         ./scripts/run test                   # Run everything
         ./scripts/run test --unit            # JUnit unit tests only
         ./scripts/run test --fast            # Skip slow tests
         ./scripts/run test --mutation        # Mutation testing only
+        ./scripts/run test --sequential      # One check at a time (debugging)
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
     console.print(Panel.fit("[bold blue]Running Quality Checks[/bold blue]"))
 
-    # Determine what to run
+    # Determine what to run. Checks in the same group share target/ and ~/.m2
+    # (or port 8080 for fuzzing) and must not overlap; groups are independent.
     run_all = not any([unit, integration, frontend, mutation, security])
-    results: Dict[str, Tuple[str, int]] = {}
+    fuzzing_cmd = [sys.executable, str(ROOT / "scripts" / "api_fuzzing.py"), "--start-app"]
+    jobs: List[Tuple[str, str, CheckRunner]] = []
 
-    # Unit tests
     if run_all or unit:
-        console.print("\n[bold]Running JUnit unit tests...[/bold]")
-        rc = _run_maven(["test"])
-        results["Unit Tests"] = ("PASS" if rc == 0 else "FAIL", rc)
-
-    # Integration tests
+        jobs.append(("maven", "Unit Tests", lambda log: _run_maven(["test"], log_path=log)))
     if run_all or integration:
-        console.print("\n[bold]Running integration tests...[/bold]")
-        rc = _run_maven(["verify", "-DskipITs=false"])
-        results["Integration Tests"] = ("PASS" if rc == 0 else "FAIL", rc)
-
-    # Frontend tests
+        jobs.append(("maven", "Integration Tests", lambda log: _run_maven(["verify", "-DskipITs=false"], log_path=log)))
     if run_all or frontend:
-        console.print("\n[bold]Running frontend tests...[/bold]")
-        rc = _run_npm(["run", "test:run"], cwd=FRONTEND_DIR)
-        results["Frontend Tests"] = ("PASS" if rc == 0 else "FAIL", rc)
-
-    # Mutation testing (slow)
+        jobs.append(("frontend", "Frontend Tests", lambda log: _run_npm(["run", "test:run"], log_path=log)))
     if (run_all and not fast) or mutation:
-        console.print("\n[bold]Running mutation testing...[/bold]")
-        rc = _run_maven(["pitest:mutationCoverage"])
-        results["Mutation Testing"] = ("PASS" if rc == 0 else "FAIL", rc)
-
-    # Security checks (slow)
+        jobs.append(("maven", "Mutation Testing", lambda log: _run_maven(["pitest:mutationCoverage"], log_path=log)))
     if (run_all and not fast) or security:
-        console.print("\n[bold]Running security checks...[/bold]")
-        # OWASP dependency check
-        rc = _run_maven(["dependency-check:check"])
-        results["OWASP Dep-Check"] = ("PASS" if rc == 0 else "FAIL", rc)
+        jobs.append(("maven", "OWASP Dep-Check", lambda log: _run_maven(["dependency-check:check"], log_path=log)))
+        jobs.append(("maven", "API Fuzzing", lambda log: _run_command(fuzzing_cmd, ROOT, log_path=log)))
 
-        # API fuzzing
-        console.print("\n[bold]Running API fuzzing...[/bold]")
-        fuzzing_result = subprocess.run(
-            [sys.executable, str(ROOT / "scripts" / "api_fuzzing.py"), "--start-app"],
-            cwd=str(ROOT),
-        )
-        results["API Fuzzing"] = ("PASS" if fuzzing_result.returncode == 0 else "FAIL", fuzzing_result.returncode)
+    # With one group nothing would overlap; keep the live output instead of logs
+    sequential = sequential or len({group for group, _, _ in jobs}) == 1
+
+    results: Dict[str, Tuple[int, Optional[Path]]] = {}
+    if sequential:
+        for _, name, runner in jobs:
+            console.print(f"\n[bold]Running {name}...[/bold]")
+            results[name] = (runner(None), None)
+    else:
+        console.print(f"\n[bold]Running {len(jobs)} checks in parallel...[/bold]")
+        finished = _run_checks_concurrently(jobs)
+        # A stopped group leaves its remaining checks out of the summary
+        results = {name: finished[name] for _, name, _ in jobs if name in finished}
 
     # Summary
     console.print("\n")
@@ -431,11 +676,16 @@ def test(
     table.add_column("Check", style="dim")
     table.add_column("Status")
     table.add_column("Exit Code", justify="right")
+    if not sequential:
+        table.add_column("Log")
 
     all_passed = True
-    for name, (status, code) in results.items():
-        style = "green" if status == "PASS" else "red"
-        table.add_row(name, f"[{style}]{status}[/{style}]", str(code))
+    for name, (code, log_path) in results.items():
+        status, style = ("PASS", "green") if code == 0 else ("FAIL", "red")
+        row = [name, f"[{style}]{status}[/{style}]", str(code)]
+        if log_path is not None:
+            row.append(str(log_path.relative_to(ROOT)))
+        table.add_row(*row)
         if code != 0:
             all_passed = False
 
@@ -461,6 +711,7 @@ def qa_dashboard():
 
     Builds reports if needed, then opens the QA dashboard.
     """
+    console = _get_console()
     dashboard_path = ROOT / "target" / "site" / "qa-dashboard" / "index.html"
 
     # Check if reports exist
@@ -492,65 +743,79 @@ def qa_dashboard():
 @app.command("ci-local")
 def ci_local(
     fast: bool = typer.Option(False, "--fast", help="Skip slow steps (mutation, OWASP)"),
+    no_rich: bool = typer.Option(False, "--no-rich", help="Plain text output (no colors or tables)"),
 ):
     """
     Reproduce CI pipeline locally.
 
     Runs the same steps as GitHub Actions (java-ci.yml).
     """
-    console.print(Panel.fit(
-        "[bold cyan]Reproducing CI Pipeline Locally[/bold cyan]",
-        subtitle="Mirrors .github/workflows/java-ci.yml"
-    ))
+    if no_rich:
+        print("Reproducing CI Pipeline Locally (mirrors .github/workflows/java-ci.yml)")
+    else:
+        from rich.panel import Panel
+
+        _get_console().print(Panel.fit(
+            "[bold cyan]Reproducing CI Pipeline Locally[/bold cyan]",
+            subtitle="Mirrors .github/workflows/java-ci.yml"
+        ))
 
     # Build environment
     try:
-        env = CILocalEnvironment().build()
+        CILocalEnvironment().apply()
     except ValueError as e:
-        console.print(f"[red]{e}[/red]")
+        _echo(f"[red]{e}[/red]", no_rich)
         raise typer.Exit(1)
 
     results: Dict[str, int] = {}
 
     # Full verify
-    console.print("\n[bold]Step 1: mvn clean verify[/bold]")
+    _echo("\n[bold]Step 1: mvn clean verify[/bold]", no_rich)
     goals = ["clean", "verify"]
     if fast:
         goals.extend(["-DskipPitest=true", "-Ddependency-check.skip=true"])
-    rc = _run_maven(goals, env=env)
+    rc = _run_maven(goals, plain=no_rich)
     results["Build & Verify"] = rc
 
     if rc != 0:
-        console.print("[red]Build failed, stopping[/red]")
+        _echo("[red]Build failed, stopping[/red]", no_rich)
         raise typer.Exit(1)
 
     # Generate metrics
-    console.print("\n[bold]Step 2: Generate QA Dashboard[/bold]")
+    _echo("\n[bold]Step 2: Generate QA Dashboard[/bold]", no_rich)
     subprocess.run(
         [sys.executable, str(ROOT / "scripts" / "ci_metrics_summary.py")],
         cwd=str(ROOT),
-        env=env,
     )
 
     # API fuzzing (unless fast)
     if not fast:
-        console.print("\n[bold]Step 3: API Fuzzing[/bold]")
+        _echo("\n[bold]Step 3: API Fuzzing[/bold]", no_rich)
         fuzzing_result = subprocess.run(
             [sys.executable, str(ROOT / "scripts" / "api_fuzzing.py"), "--start-app"],
             cwd=str(ROOT),
-            env=env,
         )
         results["API Fuzzing"] = fuzzing_result.returncode
 
     # Summary
-    console.print("\n")
-    table = Table(title="CI Pipeline Results", show_header=True)
-    table.add_column("Step")
-    table.add_column("Status")
-    for name, code in results.items():
-        status = "[green]PASS[/green]" if code == 0 else "[red]FAIL[/red]"
-        table.add_row(name, status)
-    console.print(table)
+    rows = [
+        (name, "[green]PASS[/green]" if code == 0 else "[red]FAIL[/red]")
+        for name, code in results.items()
+    ]
+    if no_rich:
+        print()
+        _print_plain_table("CI Pipeline Results", ("Step", "Status"), rows)
+    else:
+        from rich.table import Table
+
+        console = _get_console()
+        console.print("\n")
+        table = Table(title="CI Pipeline Results", show_header=True)
+        table.add_column("Step")
+        table.add_column("Status")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
 
     all_passed = all(rc == 0 for rc in results.values())
     raise typer.Exit(0 if all_passed else 1)
@@ -560,9 +825,24 @@ def ci_local(
 # cs health - Check service health
 # ==============================================================================
 
+def _new_health_table() -> "Table":
+    """
+    Return an empty health table with its columns configured.
+    Rich stores cells on the columns, so each refresh takes a fresh table
+    rather than clearing rows on the last one.
+    """
+    from rich.table import Table
+
+    table = Table(title=HEALTH_TABLE_TITLE, show_header=True, header_style="bold cyan")
+    for header in HEALTH_TABLE_HEADERS:
+        table.add_column(header, justify="right" if header == "Latency" else "left")
+    return table
+
+
 @app.command()
 def health(
     watch: bool = typer.Option(False, "--watch", help="Continuous monitoring (refresh every 5s)"),
+    no_rich: bool = typer.Option(False, "--no-rich", help="Plain text output (no colors or tables)"),
 ):
     """
     Quick health check of all services.
@@ -570,47 +850,84 @@ def health(
     [bold]Examples:[/bold]
         ./scripts/run health              # Check all services once
         ./scripts/run health --watch      # Continuous monitoring
+        ./scripts/run health --no-rich    # Plain text (scripts, CI logs)
     """
-    def print_health_table():
-        table = Table(title="Contact Suite Health Check", show_header=True, header_style="bold cyan")
-        table.add_column("Service")
-        table.add_column("Status")
-        table.add_column("Latency", justify="right")
-        table.add_column("URL")
-
-        # Backend API
-        is_up, latency, status = _check_health(HEALTH_URL)
-        status_display = "[green]UP[/green]" if is_up else f"[red]{status}[/red]"
-        table.add_row("Backend API", status_display, f"{latency}ms", ":8080")
-
-        # Frontend
-        is_up, latency, status = _check_frontend()
-        status_display = "[green]UP[/green]" if is_up else f"[yellow]{status}[/yellow]"
-        table.add_row("Frontend", status_display, f"{latency}ms", ":5173")
-
-        # PostgreSQL
-        is_up, latency, status = _check_postgres()
-        status_display = "[green]UP[/green]" if is_up else f"[yellow]{status}[/yellow]"
-        table.add_row("PostgreSQL", status_display, f"{latency}ms", ":5432")
+    # (service, probe, style when down, URL) in display order
+    probes = [
+        ("Backend API", functools.partial(_check_health, HEALTH_URL), "red", ":8080"),
+        ("Frontend", _check_frontend, "yellow", ":5173"),
+        ("PostgreSQL", _check_postgres, "yellow", ":5432"),
+        ("Actuator", functools.partial(_check_health, "http://localhost:8080/actuator/info"), "red", ":8080/actuator"),
+    ]
 
-        # Actuator
-        is_up, latency, status = _check_health("http://localhost:8080/actuator/info")
-        status_display = "[green]UP[/green]" if is_up else f"[red]{status}[/red]"
-        table.add_row("Actuator", status_display, f"{latency}ms", ":8080/actuator")
+    # Create the client up front so its setup (SSL context) isn't billed as probe latency
+    _http_client()
 
-        console.print(table)
-
-    if watch:
+    def probe_rows() -> List[Tuple[str, str, str, str]]:
+        # Probe concurrently so a down service costs one timeout, not one per probe.
+        results: Dict[str, Tuple[bool, int, str]] = {}
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        futures = {executor.submit(probe): service for service, probe, _, _ in probes}
         try:
+            for future in as_completed(futures, timeout=5):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            pass  # Stragglers are reported as TIMEOUT below
+        finally:
+            # Don't block the table on a hung probe. Its thread is still joined at
+            # interpreter exit, bounded by the probe's own 5s socket timeout.
+            executor.shutdown(wait=False)
+
+        rows = []
+        for service, _, down_style, url in probes:
+            if service not in results:
+                rows.append((service, "[red]TIMEOUT[/red]", "-", url))
+                continue
+            is_up, latency, status = results[service]
+            status_display = "[green]UP[/green]" if is_up else f"[{down_style}]{status}[/{down_style}]"
+            rows.append((service, status_display, f"{latency}ms", url))
+        return rows
+
+    def build_table(rows: List[Tuple[str, str, str, str]]) -> "Table":
+        table = _new_health_table()
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    if not watch:
+        if no_rich:
+            _print_plain_table(HEALTH_TABLE_TITLE, HEALTH_TABLE_HEADERS, probe_rows())
+        else:
+            _get_console().print(build_table(probe_rows()))
+        return
+
+    footer = f"\n[dim]Refreshing every {HEALTH_REFRESH_SECONDS:g}s. Press Ctrl+C to stop.[/dim]"
+    # Schedule on the monotonic clock so time spent probing doesn't stretch the period.
+    next_tick = time.monotonic()
+
+    def sleep_until_next_tick():
+        nonlocal next_tick
+        next_tick += HEALTH_REFRESH_SECONDS
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+
+    try:
+        if no_rich:
             while True:
-                console.clear()
-                print_health_table()
-                console.print("\n[dim]Refreshing every 5s. Press Ctrl+C to stop.[/dim]")
-                time.sleep(5)
-        except KeyboardInterrupt:
-            pass
-    else:
-        print_health_table()
+                _print_plain_table(HEALTH_TABLE_TITLE, HEALTH_TABLE_HEADERS, probe_rows())
+                _echo(footer, plain=True)
+                sleep_until_next_tick()
+        else:
+            from rich.console import Group
+            from rich.live import Live
+            from rich.text import Text
+
+            # Live redraws in place instead of clearing the screen every refresh.
+            with Live(console=_get_console(), refresh_per_second=4) as live:
+                while True:
+                    live.update(Group(build_table(probe_rows()), Text.from_markup(footer)))
+                    sleep_until_next_tick()
+    except KeyboardInterrupt:
+        pass
 
 
 # ==============================================================================
@@ -620,6 +937,7 @@ def health(
 @db_app.command("start")
 def db_start():
     """Start Postgres container."""
+    console = _get_console()
     console.print("[bold]Starting Postgres container...[/bold]")
     try:
         _ensure_postgres(COMPOSE_FILE)
@@ -634,6 +952,7 @@ def db_stop(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Stop Postgres container (data persists)."""
+    console = _get_console()
     if not force:
         if not _confirm("Stop Postgres container? Data will persist."):
             console.print("[yellow]Cancelled[/yellow]")
@@ -641,11 +960,8 @@ def db_stop(
 
     console.print("[bold]Stopping Postgres container...[/bold]")
     compose_cmd = _resolve_compose_command()
-    result = subprocess.run(
-        compose_cmd + ["-f", str(COMPOSE_FILE), "stop"],
-        cwd=str(ROOT),
-    )
-    if result.returncode == 0:
+    rc = _run_interruptible(list(compose_cmd) + ["-f", str(COMPOSE_FILE), "stop"], ROOT)
+    if rc == 0:
         console.print("[green]Postgres stopped[/green]")
     else:
         console.print("[red]Failed to stop Postgres[/red]")
@@ -653,22 +969,33 @@ def db_stop(
 
 
 @db_app.command("status")
-def db_status():
+def db_status(
+    no_rich: bool = typer.Option(False, "--no-rich", help="Plain text output (no colors or tables)"),
+):
     """Show container status and connection info."""
     is_up, latency, status = _check_postgres()
 
+    rows = [
+        ("Container", "[green]Running[/green]" if is_up else "[red]Stopped[/red]"),
+        ("Host", "localhost"),
+        ("Port", "5432"),
+        ("Database", "contactapp"),
+        ("Username", "contactapp"),
+        ("JDBC URL", "jdbc:postgresql://localhost:5432/contactapp"),
+    ]
+    if no_rich:
+        _print_plain_table("PostgreSQL Status", ("Property", "Value"), rows)
+        return
+
+    from rich.table import Table
+
     table = Table(title="PostgreSQL Status", show_header=True)
     table.add_column("Property")
     table.add_column("Value")
+    for row in rows:
+        table.add_row(*row)
 
-    table.add_row("Container", "[green]Running[/green]" if is_up else "[red]Stopped[/red]")
-    table.add_row("Host", "localhost")
-    table.add_row("Port", "5432")
-    table.add_row("Database", "contactapp")
-    table.add_row("Username", "contactapp")
-    table.add_row("JDBC URL", "jdbc:postgresql://localhost:5432/contactapp")
-
-    console.print(table)
+    _get_console().print(table)
 
 
 @db_app.command("reset")
@@ -676,6 +1003,7 @@ def db_reset(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Drop and recreate database (DESTRUCTIVE)."""
+    console = _get_console()
     if not force:
         console.print("[bold red]WARNING: This will DELETE ALL DATA![/bold red]")
         if not _confirm("Are you sure you want to reset the database?"):
@@ -687,7 +1015,7 @@ def db_reset(
 
     # Stop and remove container
     result = subprocess.run(
-        compose_cmd + ["-f", str(COMPOSE_FILE), "down", "-v"],
+        list(compose_cmd) + ["-f", str(COMPOSE_FILE), "down", "-v"],
         cwd=str(ROOT),
     )
     if result.returncode != 0:
@@ -705,16 +1033,17 @@ def db_logs(
 ):
     """Tail Postgres logs."""
     compose_cmd = _resolve_compose_command()
-    cmd = compose_cmd + ["-f", str(COMPOSE_FILE), "logs"]
+    cmd = list(compose_cmd) + ["-f", str(COMPOSE_FILE), "logs"]
     if follow:
         cmd.append("-f")
     cmd.append("postgres")
-    subprocess.run(cmd, cwd=str(ROOT))
+    _run_interruptible(cmd, ROOT)
 
 
 @db_app.command("migrate")
 def db_migrate():
     """Run Flyway migrations manually."""
+    console = _get_console()
     console.print("[bold]Running Flyway migrations...[/bold]")
     rc = _run_maven(["flyway:migrate"])
     if rc == 0:
@@ -728,6 +1057,58 @@ def db_migrate():
 # cs setup-ssl - Generate self-signed SSL certificate
 # ==============================================================================
 
+def _write_self_signed_keystore(
+    keystore_path: Path, cert_path: Path, cn: str, password: str, alias: str, days: int = 365
+) -> None:
+    """
+    Generate the key pair and self-signed certificate in-process with
+    ``cryptography`` and write the PKCS12 keystore plus a PEM copy of the
+    certificate, matching what the two keytool calls produce.
+    """
+    import datetime
+    import ipaddress
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.hazmat.primitives.serialization import pkcs12
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    # Same DN as keytool's -dname (RDNs listed most significant first)
+    name = x509.Name([
+        x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "Dev"),
+        x509.NameAttribute(NameOID.LOCALITY_NAME, "Local"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "ContactApp"),
+        x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "Development"),
+        x509.NameAttribute(NameOID.COMMON_NAME, cn),
+    ])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=days))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName(cn), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    keystore_path.write_bytes(
+        pkcs12.serialize_key_and_certificates(
+            alias.encode(), key, cert, None, serialization.BestAvailableEncryption(password.encode())
+        )
+    )
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+
 @app.command("setup-ssl")
 def setup_ssl(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing keystore"),
@@ -748,9 +1129,19 @@ def setup_ssl(
         macOS: security add-trusted-cert -p ssl -k ~/Library/Keychains/login.keychain certs/local-cert.crt
         Linux: sudo cp certs/local-cert.crt /usr/local/share/ca-certificates/ && sudo update-ca-certificates
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    from rich.table import Table
+    from rich.text import Text
+
+    console = _get_console()
     keystore_path = ROOT / "src" / "main" / "resources" / "local-ssl.p12"
     certs_dir = ROOT / "certs"
     cert_path = certs_dir / "local-cert.crt"
+    # Display paths for the summary and trust instructions
+    rel_keystore = str(keystore_path.relative_to(ROOT))
+    rel_cert = str(cert_path.relative_to(ROOT))
 
     # Check if keystore exists
     if keystore_path.exists() and not force:
@@ -758,9 +1149,10 @@ def setup_ssl(
         console.print("Use --force to overwrite")
         raise typer.Exit(1)
 
-    # Check for keytool
-    if not shutil.which("keytool"):
-        console.print("[red]keytool not found. Install Java JDK.[/red]")
+    # Generate in-process when cryptography is installed; otherwise shell out to keytool
+    use_cryptography = importlib.util.find_spec("cryptography") is not None
+    if not use_cryptography and not _which("keytool"):
+        console.print("[red]keytool not found. Install Java JDK (or pip install cryptography).[/red]")
         raise typer.Exit(1)
 
     console.print(Panel.fit("[bold cyan]SSL Certificate Setup[/bold cyan]"))
@@ -768,69 +1160,89 @@ def setup_ssl(
     # Create certs directory
     certs_dir.mkdir(exist_ok=True)
 
-    # Generate keystore with self-signed certificate
-    console.print("\n[bold]Step 1: Generating PKCS12 keystore...[/bold]")
     keystore_password = "changeit"  # Standard dev password
 
-    keytool_gen_cmd = [
-        "keytool", "-genkeypair",
-        "-alias", "local-ssl",
-        "-keyalg", "RSA",
-        "-keysize", "2048",
-        "-validity", "365",
-        "-keystore", str(keystore_path),
-        "-storetype", "PKCS12",
-        "-storepass", keystore_password,
-        "-keypass", keystore_password,
-        "-dname", f"CN={cn}, OU=Development, O=ContactApp, L=Local, ST=Dev, C=US",
-        "-ext", f"SAN=dns:{cn},ip:127.0.0.1",
-    ]
-
-    result = subprocess.run(keytool_gen_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        console.print(f"[red]Failed to generate keystore:[/red]\n{result.stderr}")
-        raise typer.Exit(1)
-    console.print(f"[green]Created: {keystore_path}[/green]")
-
-    # Export certificate
-    console.print("\n[bold]Step 2: Exporting certificate...[/bold]")
-    keytool_export_cmd = [
-        "keytool", "-exportcert",
-        "-alias", "local-ssl",
-        "-keystore", str(keystore_path),
-        "-storepass", keystore_password,
-        "-rfc",
-        "-file", str(cert_path),
-    ]
-
-    result = subprocess.run(keytool_export_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        console.print(f"[red]Failed to export certificate:[/red]\n{result.stderr}")
-        raise typer.Exit(1)
-    console.print(f"[green]Created: {cert_path}[/green]")
+    if use_cryptography:
+        console.print("\n[bold]Generating PKCS12 keystore and certificate...[/bold]")
+        try:
+            _write_self_signed_keystore(keystore_path, cert_path, cn, keystore_password, alias="local-ssl")
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Failed to generate keystore:[/red]\n{e}")
+            raise typer.Exit(1)
+        console.print(f"[green]Created: {keystore_path}[/green]")
+        console.print(f"[green]Created: {cert_path}[/green]")
+    else:
+        # Generate keystore with self-signed certificate
+        console.print("\n[bold]Step 1: Generating PKCS12 keystore...[/bold]")
+        keytool_gen_cmd = [
+            "keytool", "-genkeypair",
+            "-alias", "local-ssl",
+            "-keyalg", "RSA",
+            "-keysize", "2048",
+            "-validity", "365",
+            "-keystore", str(keystore_path),
+            "-storetype", "PKCS12",
+            "-storepass", keystore_password,
+            "-keypass", keystore_password,
+            "-dname", f"CN={cn}, OU=Development, O=ContactApp, L=Local, ST=Dev, C=US",
+            "-ext", f"SAN=dns:{cn},ip:127.0.0.1",
+        ]
+
+        result = subprocess.run(keytool_gen_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            console.print(f"[red]Failed to generate keystore:[/red]\n{result.stderr}")
+            raise typer.Exit(1)
+        console.print(f"[green]Created: {keystore_path}[/green]")
+
+        # Export certificate
+        console.print("\n[bold]Step 2: Exporting certificate...[/bold]")
+        keytool_export_cmd = [
+            "keytool", "-exportcert",
+            "-alias", "local-ssl",
+            "-keystore", str(keystore_path),
+            "-storepass", keystore_password,
+            "-rfc",
+            "-file", str(cert_path),
+        ]
+
+        result = subprocess.run(keytool_export_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            console.print(f"[red]Failed to export certificate:[/red]\n{result.stderr}")
+            raise typer.Exit(1)
+        console.print(f"[green]Created: {cert_path}[/green]")
 
     # Print usage instructions
-    console.print("\n")
     table = Table(title="SSL Setup Complete", show_header=True, header_style="bold green")
     table.add_column("Item")
     table.add_column("Value")
-    table.add_row("Keystore", str(keystore_path.relative_to(ROOT)))
-    table.add_row("Certificate", str(cert_path.relative_to(ROOT)))
+    table.add_row("Keystore", rel_keystore)
+    table.add_row("Certificate", rel_cert)
     table.add_row("Password", keystore_password)
     table.add_row("Alias", "local-ssl")
     table.add_row("Validity", "365 days")
     console.print(table)
 
-    console.print("\n[bold]To enable HTTPS:[/bold]")
-    console.print("  export SSL_ENABLED=true")
-    console.print("  ./scripts/run dev")
-    console.print("\n[bold]To trust the certificate (macOS):[/bold]")
-    console.print(f"  security add-trusted-cert -p ssl -k ~/Library/Keychains/login.keychain {cert_path.relative_to(ROOT)}")
-    console.print("\n[bold]To trust the certificate (Linux):[/bold]")
-    console.print(f"  sudo cp {cert_path.relative_to(ROOT)} /usr/local/share/ca-certificates/")
-    console.print("  sudo update-ca-certificates")
-
-    console.print("\n[dim]Note: SSL is disabled by default (SSL_ENABLED=false)[/dim]")
+    def commands(title: str, lines: str) -> Group:
+        heading = Text.from_markup(f"\n[bold]{title}:[/bold]")
+        return Group(heading, Syntax(lines, "bash", theme="ansi_dark", background_color="default"))
+
+    # One render for all follow-up commands. soft_wrap leaves long lines to the
+    # terminal, so each command copies as a single line without borders.
+    console.print(
+        Group(
+            commands("To enable HTTPS", "export SSL_ENABLED=true\n./scripts/run dev"),
+            commands(
+                "To trust the certificate (macOS)",
+                f"security add-trusted-cert -p ssl -k ~/Library/Keychains/login.keychain {rel_cert}",
+            ),
+            commands(
+                "To trust the certificate (Linux)",
+                f"sudo cp {rel_cert} /usr/local/share/ca-certificates/\nsudo update-ca-certificates",
+            ),
+            Text.from_markup("\n[dim]Note: SSL is disabled by default (SSL_ENABLED=false)[/dim]"),
+        ),
+        soft_wrap=True,
+    )
 
 
 # ==============================================================================
@@ -845,6 +1257,7 @@ def dashboard():
     Opens the admin dashboard at /admin/devops.
     Requires ADMIN user login.
     """
+    console = _get_console()
     # Check if backend is running
     is_up, _, _ = _check_health(HEALTH_URL)
     if not is_up:
@@ -8,12 +8,16 @@ then launches the React dev server so both stacks are ready in a single command.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
+import queue
 import shlex
+import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Sequence, Tuple
@@ -59,11 +63,43 @@ def _maybe_install_frontend(skip_install: bool) -> None:
     _run(["npm", "install"], cwd=FRONTEND_DIR)
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which, cached per process (PATH doesn't change during a run)."""
+    return shutil.which(name)
+
+
 def _start_process(cmd: Sequence[str], *, cwd: Path, env: Dict[str, str] | None = None) -> subprocess.Popen:
     """Spawn a long-running process (backend or frontend) and immediately return the handle."""
     return subprocess.Popen(cmd, cwd=str(cwd), env=env)
 
 
+def _wait_for_first_exit(children: List[Tuple[str, subprocess.Popen]]) -> Tuple[str, subprocess.Popen]:
+    """
+    Block until any child exits and return its (name, process) entry.
+    Each child gets a daemon thread parked in Popen.wait(), so the supervisor
+    sleeps in the kernel instead of polling every second.
+    """
+    exited: "queue.Queue[Tuple[str, subprocess.Popen]]" = queue.Queue()
+
+    def _watch(name: str, proc: subprocess.Popen) -> None:
+        proc.wait()
+        exited.put((name, proc))
+
+    for name, proc in children:
+        threading.Thread(target=_watch, args=(name, proc), daemon=True).start()
+
+    if os.name == "posix":
+        return exited.get()
+    # Windows cannot interrupt a blocking lock wait with Ctrl+C, so wake up
+    # periodically to let KeyboardInterrupt through.
+    while True:
+        try:
+            return exited.get(timeout=1)
+        except queue.Empty:
+            continue
+
+
 def _attach_signal_handlers(children: List[Tuple[str, subprocess.Popen]]) -> None:
     """Ensure Ctrl+C or SIGTERM stops both processes cleanly."""
 
@@ -152,14 +188,21 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _resolve_compose_command() -> List[str]:
-    """Return the docker compose command supported on this machine."""
-    candidates = (["docker", "compose"], ["docker-compose"])
+@functools.lru_cache(maxsize=1)
+def _resolve_compose_command() -> Tuple[str, ...]:
+    """
+    Return the docker compose command supported on this machine.
+    Cached: probing forks `docker compose version`, and db reset resolves twice.
+    """
+    candidates = (("docker", "compose"), ("docker-compose",))
     errors = []
     for candidate in candidates:
+        if _which(candidate[0]) is None:
+            errors.append(" ".join(candidate))
+            continue
         try:
             subprocess.run(
-                candidate + ["version"],
+                [*candidate, "version"],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 check=True,
@@ -185,7 +228,7 @@ def _ensure_postgres(compose_file: Path) -> None:
     compose_cmd = _resolve_compose_command()
     try:
         subprocess.run(
-            compose_cmd + ["-f", str(compose_file), "up", "-d"],
+            list(compose_cmd) + ["-f", str(compose_file), "up", "-d"],
             cwd=str(ROOT),
             check=True,
         )
@@ -262,11 +305,8 @@ def main() -> None:
     )
 
     try:
-        while True:
-            for name, proc in running:
-                if proc.poll() is not None:
-                    raise RuntimeError(f"{name} process exited with code {proc.returncode}")
-            time.sleep(1)
+        name, proc = _wait_for_first_exit(running)
+        raise RuntimeError(f"{name} process exited with code {proc.returncode}")
     except KeyboardInterrupt:
         pass
     finally:
@@ -9,15 +9,16 @@ automatically based on the mode, with guard rails to prevent common mistakes.
 Usage:
     from scripts.runtime_env import DevEnvironment, ProdLocalEnvironment
 
-    # Development mode
-    env = DevEnvironment(database="postgres").build()
+    # Development mode: export into os.environ for child processes
+    DevEnvironment(database="postgres").apply()
 
     # Production simulation
-    env = ProdLocalEnvironment().build()  # Will raise if JWT_SECRET not set
+    overrides = ProdLocalEnvironment().build()  # Will raise if JWT_SECRET not set
 """
 
 from __future__ import annotations
 
+import hmac
 import os
 import re
 from abc import ABC, abstractmethod
@@ -80,6 +81,12 @@ class EnvironmentBuilder(ABC):
 
     def __init__(self):
         self._config = EnvironmentConfig()
+        self._cache_config_values()
+
+    def _cache_config_values(self) -> None:
+        """Precompute the Enum-derived values build() reads. Call after changing mode."""
+        self._profile_value = self._config.spring_profile.value
+        self._is_postgres = self._config.database is DatabaseType.POSTGRES
 
     @abstractmethod
     def validate(self) -> None:
@@ -87,16 +94,35 @@ class EnvironmentBuilder(ABC):
         pass
 
     def build(self) -> Dict[str, str]:
-        """Build and return the environment dictionary."""
+        """
+        Build and return the variables this mode sets.
+
+        Only the overrides are returned, not a copy of os.environ. Merge them
+        when spawning a process: env={**os.environ, **builder.build()}.
+        """
+        self.validate()
+        return self._compute_overrides()
+
+    def apply(self) -> None:
+        """
+        Validate, then export the overrides into os.environ so child processes
+        inherit them without an env= argument.
+
+        One-way: the CLI process is short-lived, so nothing is restored.
+        """
         self.validate()
-        env = os.environ.copy()
+        os.environ.update(self._compute_overrides())
+
+    def _compute_overrides(self) -> Dict[str, str]:
+        """Return the variables this mode sets (no validation)."""
+        env: Dict[str, str] = {}
 
         # Cookie security
         env["APP_AUTH_COOKIE_SECURE"] = str(self._config.cookie_secure).lower()
         env["COOKIE_SECURE"] = str(self._config.cookie_secure).lower()
 
         # Spring profile
-        env["SPRING_PROFILES_ACTIVE"] = self._config.spring_profile.value
+        env["SPRING_PROFILES_ACTIVE"] = self._profile_value
 
         # CSP relaxation (for Vite HMR)
         if self._config.csp_relaxed:
@@ -109,12 +135,17 @@ class EnvironmentBuilder(ABC):
         # SSL requirement
         env["REQUIRE_SSL"] = str(self._config.require_ssl).lower()
 
-        # Postgres configuration
-        if self._config.database == DatabaseType.POSTGRES:
-            env.setdefault("SPRING_DATASOURCE_URL", self._config.postgres_url)
-            env.setdefault("SPRING_DATASOURCE_USERNAME", self._config.postgres_username)
-            env.setdefault("SPRING_DATASOURCE_PASSWORD", self._config.postgres_password)
-            env.setdefault("SPRING_DATASOURCE_DRIVER_CLASS_NAME", "org.postgresql.Driver")
+        # Postgres configuration (defaults only; values already exported win)
+        if self._is_postgres:
+            postgres_defaults = {
+                "SPRING_DATASOURCE_URL": self._config.postgres_url,
+                "SPRING_DATASOURCE_USERNAME": self._config.postgres_username,
+                "SPRING_DATASOURCE_PASSWORD": self._config.postgres_password,
+                "SPRING_DATASOURCE_DRIVER_CLASS_NAME": "org.postgresql.Driver",
+            }
+            for key, value in postgres_defaults.items():
+                if key not in os.environ:
+                    env[key] = value
 
         # Extra variables
         env.update(self._config.extra_vars)
@@ -132,7 +163,7 @@ class DevEnvironment(EnvironmentBuilder):
     - Dev default JWT secret allowed
 
     Usage:
-        env = DevEnvironment(database="postgres").build()
+        overrides = DevEnvironment(database="postgres").build()
     """
 
     def __init__(self, database: str = "h2"):
@@ -141,12 +172,16 @@ class DevEnvironment(EnvironmentBuilder):
         self._config.csp_relaxed = True
         self._config.require_ssl = False
 
-        if database.lower() == "postgres":
+        db = database.lower()
+        if db == DatabaseType.POSTGRES.value:
             self._config.database = DatabaseType.POSTGRES
             self._config.spring_profile = SpringProfile.DEV
-        else:
+        elif db == DatabaseType.H2.value:
             self._config.database = DatabaseType.H2
             self._config.spring_profile = SpringProfile.DEFAULT
+        else:
+            raise ValueError(f"Unknown database: {database!r} (expected 'h2' or 'postgres')")
+        self._cache_config_values()
 
     def with_postgres_credentials(
         self,
@@ -177,7 +212,7 @@ class ProdLocalEnvironment(EnvironmentBuilder):
 
     Usage:
         # Will raise if JWT_SECRET not set
-        env = ProdLocalEnvironment().build()
+        overrides = ProdLocalEnvironment().build()
     """
 
     def __init__(self):
@@ -188,6 +223,7 @@ class ProdLocalEnvironment(EnvironmentBuilder):
         self._config.database = DatabaseType.POSTGRES
         self._config.spring_profile = SpringProfile.PROD
         self._config.jwt_secret = os.environ.get("JWT_SECRET")
+        self._cache_config_values()
 
     def with_https(self) -> "ProdLocalEnvironment":
         """Enable HTTPS requirement (for self-signed cert testing)."""
@@ -198,21 +234,25 @@ class ProdLocalEnvironment(EnvironmentBuilder):
         """Validate production requirements."""
         jwt_secret = self._config.jwt_secret
 
+        # Fast path for the usual case; the branches below only explain failures
+        if is_jwt_secret_valid(jwt_secret):
+            return
+
         if not jwt_secret:
             raise ValueError(
                 "JWT_SECRET environment variable is required for prod-local mode.\n"
                 "Set it with: export JWT_SECRET=$(openssl rand -base64 32)"
             )
 
-        if jwt_secret == DEV_DEFAULT_JWT_SECRET:
+        if len(jwt_secret) < 32:
             raise ValueError(
-                "JWT_SECRET cannot be the dev default in prod-local mode.\n"
+                f"JWT_SECRET must be at least 32 characters (got {len(jwt_secret)}).\n"
                 "Generate a secure secret with: openssl rand -base64 32"
             )
 
-        if len(jwt_secret) < 32:
+        if _is_dev_default_jwt_secret(jwt_secret):
             raise ValueError(
-                f"JWT_SECRET must be at least 32 characters (got {len(jwt_secret)}).\n"
+                "JWT_SECRET cannot be the dev default in prod-local mode.\n"
                 "Generate a secure secret with: openssl rand -base64 32"
             )
 
@@ -226,7 +266,7 @@ class CILocalEnvironment(EnvironmentBuilder):
     - NVD_API_KEY optional (faster OWASP scans if set)
 
     Usage:
-        env = CILocalEnvironment().build()
+        overrides = CILocalEnvironment().build()
     """
 
     def __init__(self):
@@ -235,6 +275,7 @@ class CILocalEnvironment(EnvironmentBuilder):
         self._config.spring_profile = SpringProfile.DEFAULT
         self._config.csp_relaxed = False
         self._config.require_ssl = False
+        self._cache_config_values()
 
     def validate(self) -> None:
         """CI mode validates NVD_API_KEY presence (warning only)."""
@@ -247,21 +288,28 @@ class CILocalEnvironment(EnvironmentBuilder):
             )
 
 
+def _is_dev_default_jwt_secret(secret: str) -> bool:
+    """Constant-time comparison against the dev default (bytes, so non-ASCII is safe)."""
+    return hmac.compare_digest(secret.encode("utf-8", "surrogateescape"), DEV_DEFAULT_JWT_SECRET.encode("utf-8"))
+
+
 def is_jwt_secret_valid(secret: Optional[str]) -> bool:
     """Check if a JWT secret is valid for production use."""
-    if not secret:
-        return False
-    if secret == DEV_DEFAULT_JWT_SECRET:
+    # Cheap length reject first, then the constant-time dev-default check
+    if not secret or len(secret) < 32:
         return False
-    if len(secret) < 32:
+    if _is_dev_default_jwt_secret(secret):
         return False
     return True
 
 
 def mask_sensitive_value(value: str) -> str:
     """Mask a sensitive value for logging (show first/last 2 chars)."""
-    if len(value) <= 4:
-        return "****"
+    return "****" if len(value) <= 4 else _mask_long(value)
+
+
+def _mask_long(value: str) -> str:
+    """Mask a value already known to be longer than 4 chars (e.g. a validated JWT secret)."""
     return f"{value[:2]}...{value[-2:]}"
 
 
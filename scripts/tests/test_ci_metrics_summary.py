@@ -0,0 +1,211 @@
+"""
+Unit tests for ci_metrics_summary.py report loaders.
+
+Tests cover:
+- JaCoCo LINE counter lookup
+- PITest mutations.xml counting
+- Surefire TEST-*.xml aggregation
+- Dependency-Check JSON counting (streamed and fully loaded)
+- Missing and malformed reports
+- Precomputed progress bars
+"""
+
+import json
+
+import pytest
+
+from scripts import ci_metrics_summary
+
+
+@pytest.fixture
+def target(tmp_path, monkeypatch):
+    """Point the loaders at an empty Maven target/ directory."""
+    monkeypatch.setattr(ci_metrics_summary, "JACOCO_REPORT", tmp_path / "site" / "jacoco" / "jacoco.xml")
+    monkeypatch.setattr(ci_metrics_summary, "PITEST_REPORT", tmp_path / "pit-reports" / "mutations.xml")
+    monkeypatch.setattr(ci_metrics_summary, "DEPENDENCY_CHECK_REPORT", tmp_path / "dependency-check-report.json")
+    monkeypatch.setattr(ci_metrics_summary, "SUREFIRE_DIR", tmp_path / "surefire-reports")
+    return tmp_path
+
+
+def write_jacoco(target, body):
+    report_dir = target / "site" / "jacoco"
+    report_dir.mkdir(parents=True)
+    (report_dir / "jacoco.xml").write_text(f'<report name="app">{body}</report>')
+
+
+def write_pitest(target, body):
+    report_dir = target / "pit-reports"
+    report_dir.mkdir()
+    (report_dir / "mutations.xml").write_text(f"<mutations>{body}</mutations>")
+
+
+def write_surefire(target, name, attrs, body=""):
+    report_dir = target / "surefire-reports"
+    report_dir.mkdir(exist_ok=True)
+    (report_dir / name).write_text(f"<testsuite {attrs}>{body}</testsuite>")
+
+
+def write_dependency_check(target, text):
+    (target / "dependency-check-report.json").write_text(text)
+
+
+class TestLoadJacoco:
+    """Tests for load_jacoco."""
+
+    def test_reads_report_level_line_counter(self, target):
+        """The top-level LINE counter wins over nested package counters."""
+        write_jacoco(
+            target,
+            '<package name="p"><counter type="LINE" missed="9" covered="1"/></package>'
+            '<counter type="INSTRUCTION" missed="5" covered="5"/>'
+            '<counter type="LINE" missed="1" covered="3"/>',
+        )
+        assert ci_metrics_summary.load_jacoco() == {"covered": 3, "missed": 1, "total": 4, "pct": 75.0}
+
+    def test_falls_back_to_nested_counter(self, target):
+        """Without a report-level LINE counter the first nested one is used."""
+        write_jacoco(target, '<package name="p"><counter type="LINE" missed="2" covered="8"/></package>')
+        assert ci_metrics_summary.load_jacoco()["pct"] == 80.0
+
+    def test_no_line_counter_returns_none(self, target):
+        """Reports without LINE counters yield no coverage data."""
+        write_jacoco(target, '<counter type="BRANCH" missed="1" covered="1"/>')
+        assert ci_metrics_summary.load_jacoco() is None
+
+
+class TestLoadPitest:
+    """Tests for load_pitest."""
+
+    def test_missing_report_returns_none(self, target):
+        """No mutations.xml means no PITest data."""
+        assert ci_metrics_summary.load_pitest() is None
+
+    def test_counts_statuses_in_single_pass(self, target):
+        """Killed, survived and detected are tallied per mutation."""
+        write_pitest(
+            target,
+            '<mutation detected="true" status="KILLED"><sourceFile>A.java</sourceFile></mutation>'
+            '<mutation detected="false" status="SURVIVED"><sourceFile>A.java</sourceFile></mutation>'
+            '<mutation detected="true" status="TIMED_OUT"><sourceFile>B.java</sourceFile></mutation>'
+            '<mutation detected="false" status="NO_COVERAGE"><sourceFile>B.java</sourceFile></mutation>',
+        )
+        assert ci_metrics_summary.load_pitest() == {
+            "total": 4,
+            "killed": 1,
+            "survived": 1,
+            "detected": 2,
+            "pct": 25.0,
+        }
+
+    def test_empty_report_returns_zeroes(self, target):
+        """A report without mutations yields an all-zero summary."""
+        write_pitest(target, "")
+        assert ci_metrics_summary.load_pitest()["total"] == 0
+
+    def test_malformed_report_returns_none(self, target):
+        """Truncated XML is treated as missing data."""
+        write_pitest(target, '<mutation status="KILLED">')
+        assert ci_metrics_summary.load_pitest() is None
+
+
+class TestLoadSurefire:
+    """Tests for load_surefire."""
+
+    def test_missing_directory_returns_none(self, target):
+        """No surefire-reports directory means no test data."""
+        assert ci_metrics_summary.load_surefire() is None
+
+    def test_aggregates_root_attributes(self, target):
+        """Totals are summed across every TEST-*.xml suite."""
+        write_surefire(
+            target,
+            "TEST-a.xml",
+            'tests="3" failures="1" errors="0" skipped="1" time="1.25"',
+            '<testcase name="x"/><testcase name="y"/><testcase name="z"/>',
+        )
+        write_surefire(target, "TEST-b.xml", 'tests="2" failures="0" errors="1" skipped="0" time="0.5"')
+        assert ci_metrics_summary.load_surefire() == {
+            "tests": 5,
+            "failures": 1,
+            "errors": 1,
+            "skipped": 1,
+            "time": 1.75,
+        }
+
+    def test_skips_unparseable_files(self, target):
+        """Files that are not XML are ignored instead of failing the summary."""
+        write_surefire(target, "TEST-a.xml", 'tests="1" failures="0" errors="0" skipped="0" time="0.1"')
+        (target / "surefire-reports" / "TEST-broken.xml").write_text("not xml")
+        assert ci_metrics_summary.load_surefire()["tests"] == 1
+
+    def test_truncated_report_counts_root_totals(self, target):
+        """A file cut off after the <testsuite> start tag still contributes its totals."""
+        report_dir = target / "surefire-reports"
+        report_dir.mkdir()
+        (report_dir / "TEST-cut.xml").write_text(
+            '<testsuite tests="3" failures="0" errors="0" skipped="0" time="1.0"><testcase name="a">'
+        )
+        assert ci_metrics_summary.load_surefire() == {
+            "tests": 3,
+            "failures": 0,
+            "errors": 0,
+            "skipped": 0,
+            "time": 1.0,
+        }
+
+
+class TestBar:
+    """Tests for the precomputed progress bar."""
+
+    @pytest.mark.parametrize("pct", [0.0, 2.5, 33.3, 50.0, 97.5, 100.0])
+    def test_matches_direct_rendering(self, pct):
+        """Table lookups render the same bar as computing it directly."""
+        assert ci_metrics_summary.bar(pct) == ci_metrics_summary._render_bar(pct, 20)
+
+    def test_clamps_out_of_range_values(self):
+        """Values outside 0-100 are clamped to an empty or full bar."""
+        assert ci_metrics_summary.bar(-3.0) == "░" * 20
+        assert ci_metrics_summary.bar(120.0) == "█" * 20
+
+    def test_custom_width_is_rendered(self):
+        """Non-default widths bypass the lookup table."""
+        assert ci_metrics_summary.bar(50.0, width=4) == "██░░"
+
+
+class TestLoadDependencyCheck:
+    """Tests for load_dependency_check."""
+
+    REPORT = {
+        "dependencies": [
+            {"fileName": "a.jar"},
+            {"fileName": "b.jar", "vulnerabilities": [{"severity": "HIGH"}, {"severity": "weird"}]},
+            {"fileName": "c.jar", "vulnerabilities": [{"severity": "critical"}]},
+        ]
+    }
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_counts_vulnerabilities(self, target, monkeypatch, streaming):
+        """Streaming and full-load parsing produce the same counts."""
+        if streaming:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(ci_metrics_summary, "ijson", None)
+        write_dependency_check(target, json.dumps(self.REPORT))
+        result = ci_metrics_summary.load_dependency_check()
+        assert result["dependencies"] == 3
+        assert result["vulnerable_dependencies"] == 2
+        assert result["vulnerabilities"] == 3
+        assert result["severity"]["CRITICAL"] == 1
+        assert result["severity"]["HIGH"] == 1
+        assert result["severity"]["UNKNOWN"] == 1
+        assert result["severity"]["LOW"] == 0
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_malformed_report_returns_none(self, target, monkeypatch, streaming):
+        """Truncated JSON is treated as missing data."""
+        if streaming:
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr(ci_metrics_summary, "ijson", None)
+        write_dependency_check(target, '{"dependencies": [{"fileName": ')
+        assert ci_metrics_summary.load_dependency_check() is None
@@ -21,10 +21,20 @@ from scripts.runtime_env import (
     SpringProfile,
     is_jwt_secret_valid,
     mask_sensitive_value,
+    _mask_long,
     get_project_root,
     DEV_DEFAULT_JWT_SECRET,
 )
 
+VALID_JWT_SECRET = "a" * 32
+
+
+@pytest.fixture(scope="class")
+def prod_env():
+    """ProdLocalEnvironment overrides built once with a valid JWT secret."""
+    with patch.dict(os.environ, {"JWT_SECRET": VALID_JWT_SECRET}):
+        return ProdLocalEnvironment().build()
+
 
 class TestDevEnvironment:
     """Tests for DevEnvironment configuration."""
@@ -41,6 +51,16 @@ class TestDevEnvironment:
         assert env["SPRING_PROFILES_ACTIVE"] == "dev"
         assert "postgresql" in env.get("SPRING_DATASOURCE_URL", "")
 
+    def test_database_name_is_case_insensitive(self):
+        """Database names are matched case-insensitively."""
+        env = DevEnvironment(database="Postgres").build()
+        assert env["SPRING_PROFILES_ACTIVE"] == "dev"
+
+    def test_unknown_database_rejected(self):
+        """Typos are rejected instead of silently falling back to H2."""
+        with pytest.raises(ValueError, match="Unknown database: 'postgress'"):
+            DevEnvironment(database="postgress")
+
     def test_cookie_secure_disabled(self):
         """Dev environment disables secure cookies for HTTP localhost."""
         env = DevEnvironment().build()
@@ -68,6 +88,26 @@ class TestDevEnvironment:
         assert env["SPRING_DATASOURCE_USERNAME"] == "myuser"
         assert env["SPRING_DATASOURCE_PASSWORD"] == "mypass"
 
+    def test_build_returns_only_overrides(self):
+        """build() returns the mode's variables, not a copy of os.environ."""
+        with patch.dict(os.environ, {"UNRELATED_PARENT_VAR": "1"}):
+            env = DevEnvironment().build()
+        assert "UNRELATED_PARENT_VAR" not in env
+
+    def test_exported_postgres_settings_win(self):
+        """Postgres defaults are omitted for variables already exported."""
+        with patch.dict(os.environ, {"SPRING_DATASOURCE_URL": "jdbc:postgresql://other:5432/db"}):
+            env = DevEnvironment(database="postgres").build()
+        assert "SPRING_DATASOURCE_URL" not in env
+        assert env["SPRING_DATASOURCE_USERNAME"] == "contactapp"
+
+    def test_apply_exports_overrides(self):
+        """apply() writes the overrides into os.environ for child processes."""
+        with patch.dict(os.environ, {}, clear=True):
+            DevEnvironment().apply()
+            assert os.environ["SPRING_PROFILES_ACTIVE"] == "default"
+            assert os.environ["CSP_RELAXED"] == "true"
+
     def test_validation_always_passes(self):
         """Dev environment validation never fails (anything goes locally)."""
         env = DevEnvironment()
@@ -95,39 +135,24 @@ class TestProdLocalEnvironment:
             with pytest.raises(ValueError, match="must be at least 32 characters"):
                 ProdLocalEnvironment().build()
 
-    def test_accepts_valid_jwt_secret(self):
-        """ProdLocalEnvironment accepts valid JWT secret."""
-        valid_secret = "a" * 32
-        with patch.dict(os.environ, {"JWT_SECRET": valid_secret}):
-            env = ProdLocalEnvironment().build()
-            assert env["JWT_SECRET"] == valid_secret
-
-    def test_cookie_secure_enabled(self):
-        """ProdLocalEnvironment enables secure cookies."""
-        valid_secret = "a" * 32
-        with patch.dict(os.environ, {"JWT_SECRET": valid_secret}):
-            env = ProdLocalEnvironment().build()
-            assert env["APP_AUTH_COOKIE_SECURE"] == "true"
-            assert env["COOKIE_SECURE"] == "true"
-
-    def test_prod_profile_active(self):
-        """ProdLocalEnvironment uses prod profile."""
-        valid_secret = "a" * 32
-        with patch.dict(os.environ, {"JWT_SECRET": valid_secret}):
-            env = ProdLocalEnvironment().build()
-            assert env["SPRING_PROFILES_ACTIVE"] == "prod"
-
-    def test_csp_strict(self):
-        """ProdLocalEnvironment does not relax CSP."""
-        valid_secret = "a" * 32
-        with patch.dict(os.environ, {"JWT_SECRET": valid_secret}):
-            env = ProdLocalEnvironment().build()
-            assert env.get("CSP_RELAXED") != "true"
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("JWT_SECRET", VALID_JWT_SECRET),
+            ("APP_AUTH_COOKIE_SECURE", "true"),
+            ("COOKIE_SECURE", "true"),
+            ("SPRING_PROFILES_ACTIVE", "prod"),
+            ("CSP_RELAXED", None),
+            ("REQUIRE_SSL", "false"),
+        ],
+    )
+    def test_prod_settings(self, prod_env, key, expected):
+        """Valid secret accepted; secure cookies, prod profile, strict CSP, no TLS by default."""
+        assert prod_env.get(key) == expected
 
     def test_https_flag_sets_require_ssl(self):
         """with_https() sets REQUIRE_SSL to true."""
-        valid_secret = "a" * 32
-        with patch.dict(os.environ, {"JWT_SECRET": valid_secret}):
+        with patch.dict(os.environ, {"JWT_SECRET": VALID_JWT_SECRET}):
             env = ProdLocalEnvironment().with_https().build()
             assert env["REQUIRE_SSL"] == "true"
 
@@ -177,10 +202,20 @@ class TestJwtSecretValidation:
         """Dev default JWT secret is invalid for production."""
         assert is_jwt_secret_valid(DEV_DEFAULT_JWT_SECRET) is False
 
+    def test_dev_default_copy_is_invalid(self):
+        """A non-interned copy of the dev default is still rejected."""
+        secret = "".join(list(DEV_DEFAULT_JWT_SECRET))
+        assert secret is not DEV_DEFAULT_JWT_SECRET
+        assert is_jwt_secret_valid(secret) is False
+
     def test_short_secret_is_invalid(self):
         """JWT secret shorter than 32 chars is invalid."""
         assert is_jwt_secret_valid("a" * 31) is False
 
+    def test_non_ascii_secret_accepted(self):
+        """Non-ASCII secrets are compared safely instead of raising."""
+        assert is_jwt_secret_valid("é" * 32) is True
+
     def test_valid_secret_accepted(self):
         """Valid JWT secret (32+ chars, not dev default) is accepted."""
         assert is_jwt_secret_valid("a" * 32) is True
@@ -200,6 +235,10 @@ class TestMaskSensitiveValue:
         assert mask_sensitive_value("abcde") == "ab...de"
         assert mask_sensitive_value("secret123") == "se...23"
 
+    def test_mask_long_matches_public_helper(self):
+        """_mask_long masks validated secrets the same way."""
+        assert _mask_long(VALID_JWT_SECRET) == mask_sensitive_value(VALID_JWT_SECRET) == "aa...aa"
+
 
 class TestGetProjectRoot:
     """Tests for get_project_root helper."""